@@ -9,6 +9,9 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 LIB_PATH = os.path.join(SCRIPT_DIR, 'lib')
 sys.path.append(LIB_PATH)
 
+# Conversion cache sidecars written next to each image; matches image_converter.CACHE_SUFFIX.
+CACHE_SUFFIX = '.meta'
+
 class DisplayManager:
     """
     Class to manage the display of images on the e-Paper screen.
@@ -35,9 +38,9 @@ class DisplayManager:
         self.epd.init()
         self.stop_display = False
 
-    # Fetches the image files from the specified folder.
+    # Fetches the image files from the specified folder, skipping conversion cache sidecars.
     def fetch_image_files(self):
-        return [f for f in os.listdir(self.image_folder)]
+        return [f for f in os.listdir(self.image_folder) if not f.endswith(CACHE_SUFFIX)]
 
 
     # Selects a random image from the list of images.
@@ -1,7 +1,7 @@
 from image_converter import ImageConverter
 from display_manager import DisplayManager
 import os
-import shutil
+import signal
 import sys
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -11,6 +11,10 @@ SD_MOUNT_BASE = "/media/pi"  # Adjust this path as needed
 
 if __name__ == "__main__":
 
+    # sd_monitor stops this process with SIGTERM when the card changes. Exit through
+    # SystemExit so the image converter's worker pool is terminated along with it.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
     # Collect arguments from the command line
     sd_path = sys.argv[1]
     refresh_time = int(sys.argv[2])
@@ -20,11 +24,9 @@ if __name__ == "__main__":
     display_manager = DisplayManager(image_folder=PIC_PATH, refresh_time=refresh_time)
     print("Display manager created")
 
-    # Delete existing directory and create a new one
-    # This is where the images will be stored
-    if os.path.exists(PIC_PATH):
-        shutil.rmtree(PIC_PATH)
-    os.makedirs(PIC_PATH)
+    # Create the directory where the converted images are stored
+    # Existing conversions are kept and reused if their source is unchanged
+    os.makedirs(PIC_PATH, exist_ok=True)
 
     image_converter = ImageConverter(source_dir=sd_path, output_dir=PIC_PATH)
     print("Image converter created")
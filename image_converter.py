@@ -1,5 +1,26 @@
+import hashlib
+import io
+import itertools
 import os
-from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+import signal
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+
+import numpy as np
+import PIL
+from PIL import ExifTags, Image, ImageOps
+
+try:
+    import numba
+except ImportError:  # Optional: falls back to the NumPy/Python diffusion loop.
+    numba = None
+
+try:
+    import cv2
+    # process_images already runs one worker per core.
+    cv2.setNumThreads(1)
+except ImportError:  # Optional: Pillow does the resampling instead.
+    cv2 = None
 
 TARGET_WIDTH = 800
 TARGET_HEIGHT = 480
@@ -9,10 +30,21 @@ COLOR = 1.35
 SHARPEN_RADIUS = 1.0
 SHARPEN_PERCENT =200
 SHARPEN_THRESHOLD = 5
-DITHER_STRENGTH = 0.90  # 0.0 = off, 1.0 = full Floyd-Steinberg, 0.0-1.0 = scaled diffusion
+DITHER_STRENGTH = 0.90  # 0.0 = off, 1.0 = full Floyd-Steinberg, 0.0-1.0 = scaled diffusion (needs Numba)
+DITHER_LINEAR_LIGHT = True  # Diffuse error in linear light; only the Numba dither path honours this
+
+# Source file extensions (lowercase, without the dot) picked up from the SD card.
+VALID_EXTS = frozenset({'jpg', 'jpeg', 'png', 'bmp', 'gif', 'tiff'})
+
+# Sidecar written next to each output, holding the cache key it was converted under.
+CACHE_SUFFIX = ".meta"
+# Bump whenever the conversion pipeline changes its output, so existing outputs are redone.
+CACHE_VERSION = 1
 
 # Keep output as PNG to preserve indexed palette output quality.
 OUTPUT_FORMAT = "PNG"
+# Outputs are a local cache, not for distribution: favor encode speed over size.
+PNG_COMPRESS_LEVEL = 1
 
 # 6-color palette for the Waveshare 7.3" E panel.
 PALETTE = [
@@ -32,95 +64,345 @@ else:
     DITHER_NONE = Image.NONE
 
 
+def log_pillow_build():
+    # Pillow-SIMD (x86 only) ships as a ".postN" release of the Pillow version it tracks.
+    if ".post" in PIL.__version__:
+        print(f"Using Pillow-SIMD {PIL.__version__}")
+    else:
+        print(f"Using Pillow {PIL.__version__}")
+
+
+def draft_size(img):
+    """Size to request from the JPEG decoder, in the file's stored orientation."""
+    # Twice the target, like Image.thumbnail's reducing_gap, keeps LANCZOS quality.
+    if img.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8):
+        return (TARGET_HEIGHT * 2, TARGET_WIDTH * 2)
+    return (TARGET_WIDTH * 2, TARGET_HEIGHT * 2)
+
+
 def make_palette_image(palette_rgb):
     pal = Image.new("P", (1, 1))
-    flat = []
-    for color in palette_rgb:
-        flat.extend(color)
-    flat.extend([0, 0, 0] * (256 - len(palette_rgb)))
-    pal.putpalette(flat)
+    pal.putpalette(make_palette_flat(palette_rgb))
     return pal
 
 
 def make_palette_flat(palette_rgb):
-    flat = []
-    for color in palette_rgb:
-        flat.extend(color)
-    flat.extend([0, 0, 0] * (256 - len(palette_rgb)))
-    return flat
+    return bytes(itertools.chain.from_iterable(palette_rgb)).ljust(768, b"\x00")
 
 
-def clamp_u8(value):
-    return max(0.0, min(255.0, value))
+# Read-only (height, width, 3) uint8 view over one bulk copy of an RGB image's pixels.
+# The way back is Image.fromarray, which reads the array's buffer directly.
+def to_array(img_rgb):
+    return np.frombuffer(img_rgb.tobytes(), np.uint8).reshape(img_rgb.height, img_rgb.width, 3)
 
 
-def nearest_palette_index(r, g, b, palette_rgb):
-    best_idx = 0
-    best_dist = float("inf")
-    for i, (pr, pg, pb) in enumerate(palette_rgb):
-        dr = r - pr
-        dg = g - pg
-        db = b - pb
-        dist = dr * dr + dg * dg + db * db
-        if dist < best_dist:
-            best_dist = dist
-            best_idx = i
-    return best_idx
+# sRGB byte value -> linear light on the same 0-255 scale (gamma 2.2 approximation).
+SRGB_TO_LIN = ((np.arange(256) / 255.0) ** 2.2 * 255.0).astype(np.float32)
 
 
-def quantize_with_dither_strength(img_rgb, palette_rgb, dither_strength):
-    width, height = img_rgb.size
-    data = list(img_rgb.getdata())
-    px_count = width * height
-    buf = [0.0] * (px_count * 3)
-    out_idx = [0] * px_count
-
-    for i, (r, g, b) in enumerate(data):
-        bi = i * 3
-        buf[bi] = float(r)
-        buf[bi + 1] = float(g)
-        buf[bi + 2] = float(b)
-
-    def add_error(x, y, er, eg, eb, factor):
-        if x < 0 or y < 0 or x >= width or y >= height:
-            return
-        bi = (y * width + x) * 3
-        buf[bi] = clamp_u8(buf[bi] + er * factor)
-        buf[bi + 1] = clamp_u8(buf[bi + 1] + eg * factor)
-        buf[bi + 2] = clamp_u8(buf[bi + 2] + eb * factor)
+# Wraps a 2-D uint8 index array as a "P" image straight from its buffer.
+def indexed_image(out_idx, palette_flat):
+    out = Image.fromarray(out_idx, "P")
+    out.putpalette(palette_flat)
+    return out
 
-    strength = max(0.0, min(1.0, float(dither_strength)))
 
-    for y in range(height):
-        for x in range(width):
-            pi = y * width + x
-            bi = pi * 3
-            old_r = buf[bi]
-            old_g = buf[bi + 1]
-            old_b = buf[bi + 2]
+# Built once at import rather than for every image.
+_PALETTE_FLAT = make_palette_flat(PALETTE)
+_PALETTE_IMAGE = make_palette_image(PALETTE)
 
-            pal_idx = nearest_palette_index(old_r, old_g, old_b, palette_rgb)
-            new_r, new_g, new_b = palette_rgb[pal_idx]
-            out_idx[pi] = pal_idx
 
-            if strength <= 0.0:
-                continue
+def gaussian_kernel(sigma):
+    radius = max(1, int(3.0 * sigma + 0.5))
+    x = np.arange(-radius, radius + 1, dtype=np.float32)
+    kernel = np.exp(-(x * x) / (2.0 * sigma * sigma))
+    return kernel / kernel.sum()
+
 
-            er = (old_r - new_r) * strength
-            eg = (old_g - new_g) * strength
-            eb = (old_b - new_b) * strength
+def gaussian_blur(arr, sigma):
+    """Separable Gaussian blur of an (h, w, 3) float32 array with clamped edges."""
+    kernel = gaussian_kernel(sigma)
+    if cv2 is not None:
+        return cv2.sepFilter2D(arr, -1, kernel, kernel, borderType=cv2.BORDER_REPLICATE)
 
-            add_error(x + 1, y, er, eg, eb, 7.0 / 16.0)
-            add_error(x - 1, y + 1, er, eg, eb, 3.0 / 16.0)
-            add_error(x, y + 1, er, eg, eb, 5.0 / 16.0)
-            add_error(x + 1, y + 1, er, eg, eb, 1.0 / 16.0)
+    radius = len(kernel) // 2
+    height, width = arr.shape[:2]
 
-    out = Image.new("P", (width, height))
-    out.putpalette(make_palette_flat(palette_rgb))
-    out.putdata(out_idx)
+    # The kernel is symmetric, so taps at +/-i share one multiply.
+    padded = np.pad(arr, ((radius, radius), (0, 0), (0, 0)), mode="edge")
+    tmp = padded[radius:radius + height] * kernel[radius]
+    for i in range(radius):
+        tmp += (padded[i:i + height] + padded[2 * radius - i:2 * radius - i + height]) * kernel[i]
+
+    padded = np.pad(tmp, ((0, 0), (radius, radius), (0, 0)), mode="edge")
+    out = padded[:, radius:radius + width] * kernel[radius]
+    for i in range(radius):
+        out += (padded[:, i:i + width] + padded[:, 2 * radius - i:2 * radius - i + width]) * kernel[i]
     return out
 
 
+# Contrast, color and unsharp mask in one float32 pass instead of three Pillow images.
+# Mirrors ImageEnhance.Contrast/Color and ImageFilter.UnsharpMask, applied in that order.
+def enhance_image(img_rgb):
+    arr = to_array(img_rgb).astype(np.float32)
+    luma_weights = np.array([0.299, 0.587, 0.114], np.float32)
+
+    mean = float(int((arr @ luma_weights).mean() + 0.5))
+    arr *= CONTRAST
+    arr += mean * (1.0 - CONTRAST)
+    np.clip(arr, 0.0, 255.0, out=arr)
+
+    gray = arr @ (luma_weights * (1.0 - COLOR))
+    arr *= COLOR
+    arr += gray[..., None]
+    np.clip(arr, 0.0, 255.0, out=arr)
+
+    mask = gaussian_blur(arr, SHARPEN_RADIUS)
+    np.subtract(arr, mask, out=mask)
+    mask *= np.abs(mask) >= SHARPEN_THRESHOLD
+    mask *= SHARPEN_PERCENT / 100.0
+    arr += mask
+    np.clip(arr, 0.0, 255.0, out=arr)
+
+    arr += 0.5
+    return Image.fromarray(arr.astype(np.uint8))
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _fs_dither(buf, pal, out_idx, strength):
+        height, width = out_idx.shape
+        for y in range(height):
+            # Serpentine scan: odd rows run right to left with mirrored offsets,
+            # which breaks up the directional streaks of a raster scan.
+            if y % 2 == 0:
+                start, stop, step = 0, width, 1
+            else:
+                start, stop, step = width - 1, -1, -1
+            has_next = y + 1 < height
+
+            # Error terms stay in registers: the 7/16 carry for the next pixel in
+            # scan order, and the pending next-row sums for columns x - step and x.
+            # Each next-row cell is then read and written once, when it is complete.
+            cr = cg = cb = 0.0
+            ar0 = ag0 = ab0 = 0.0
+            ar1 = ag1 = ab1 = 0.0
+
+            for x in range(start, stop, step):
+                r = min(255.0, max(0.0, buf[y, x, 0] + cr))
+                g = min(255.0, max(0.0, buf[y, x, 1] + cg))
+                b = min(255.0, max(0.0, buf[y, x, 2] + cb))
+
+                best = 0
+                best_dist = 1e30
+                for k in range(pal.shape[0]):
+                    dr = r - pal[k, 0]
+                    dg = g - pal[k, 1]
+                    db = b - pal[k, 2]
+                    dist = dr * dr + dg * dg + db * db
+                    if dist < best_dist:
+                        best_dist = dist
+                        best = k
+                out_idx[y, x] = best
+
+                er = (r - pal[best, 0]) * strength
+                eg = (g - pal[best, 1]) * strength
+                eb = (b - pal[best, 2]) * strength
+
+                cr = er * (7.0 / 16.0)
+                cg = eg * (7.0 / 16.0)
+                cb = eb * (7.0 / 16.0)
+
+                if has_next:
+                    px = x - step
+                    if 0 <= px < width:
+                        buf[y + 1, px, 0] = min(255.0, max(0.0, buf[y + 1, px, 0] + ar0 + er * (3.0 / 16.0)))
+                        buf[y + 1, px, 1] = min(255.0, max(0.0, buf[y + 1, px, 1] + ag0 + eg * (3.0 / 16.0)))
+                        buf[y + 1, px, 2] = min(255.0, max(0.0, buf[y + 1, px, 2] + ab0 + eb * (3.0 / 16.0)))
+                    ar0 = ar1 + er * (5.0 / 16.0)
+                    ag0 = ag1 + eg * (5.0 / 16.0)
+                    ab0 = ab1 + eb * (5.0 / 16.0)
+                    ar1 = er * (1.0 / 16.0)
+                    ag1 = eg * (1.0 / 16.0)
+                    ab1 = eb * (1.0 / 16.0)
+
+            if has_next:
+                last = stop - step
+                buf[y + 1, last, 0] = min(255.0, max(0.0, buf[y + 1, last, 0] + ar0))
+                buf[y + 1, last, 1] = min(255.0, max(0.0, buf[y + 1, last, 1] + ag0))
+                buf[y + 1, last, 2] = min(255.0, max(0.0, buf[y + 1, last, 2] + ab0))
+        return out_idx
+else:
+    _fs_dither = None
+
+
+def warm_up_dither():
+    """Compile the JIT dither kernel ahead of the first real image."""
+    if _fs_dither is None:
+        if 0.0 < DITHER_STRENGTH < 1.0:
+            print(f"Numba is not installed; DITHER_STRENGTH {DITHER_STRENGTH} falls back to full Floyd-Steinberg")
+        return
+    buf = np.zeros((2, 2, 3), np.float32)
+    pal = np.array(PALETTE, np.float32)
+    _fs_dither(buf, pal, np.empty((2, 2), np.uint8), 1.0)
+
+
+def quantize_with_dither_strength(img_rgb, palette_rgb, dither_strength):
+    width, height = img_rgb.size
+    strength = max(0.0, min(1.0, float(dither_strength)))
+
+    if strength <= 0.0 or _fs_dither is None:
+        # Undithered, Pillow's cached C lookup is the same mapping convert_image uses. Pillow
+        # cannot scale its error diffusion, and a per-pixel Python loop is far too slow on
+        # the Pi, so without Numba any nonzero strength dithers fully.
+        palette = _PALETTE_IMAGE if palette_rgb is PALETTE else make_palette_image(palette_rgb)
+        return img_rgb.quantize(palette=palette, dither=DITHER_NONE if strength <= 0.0 else DITHER)
+
+    # Both branches yield a fresh, writable float32 buffer for the kernel.
+    if DITHER_LINEAR_LIGHT:
+        # Error in sRGB bytes is not proportional to light, so diffusing it there
+        # shifts brightness. The indices still refer to the sRGB palette.
+        buf = SRGB_TO_LIN[to_array(img_rgb)]
+        pal = SRGB_TO_LIN[np.array(palette_rgb)]
+    else:
+        buf = to_array(img_rgb).astype(np.float32)
+        pal = np.array(palette_rgb, np.float32)
+    out_idx = np.empty((height, width), np.uint8)
+    _fs_dither(buf, pal, out_idx, strength)
+
+    # The panel palette is prebuilt at import; only other palettes are flattened here.
+    palette_flat = _PALETTE_FLAT if palette_rgb is PALETTE else make_palette_flat(palette_rgb)
+    return indexed_image(out_idx, palette_flat)
+
+
+def resize_image(img):
+    size = (TARGET_WIDTH, TARGET_HEIGHT)
+    if cv2 is None:
+        return img.resize(size, Image.Resampling.LANCZOS)
+
+    # LANCZOS4 keeps a fixed-width kernel and aliases when shrinking; INTER_AREA
+    # stays close to Pillow's antialiased LANCZOS there.
+    if img.width >= TARGET_WIDTH and img.height >= TARGET_HEIGHT:
+        interpolation = cv2.INTER_AREA
+    else:
+        interpolation = cv2.INTER_LANCZOS4
+    return Image.fromarray(cv2.resize(to_array(img), size, interpolation=interpolation))
+
+
+def output_path(file_name, output_dir):
+    base_name = os.path.splitext(file_name)[0]
+    return os.path.join(output_dir, f"{base_name}_waveshare6.png")
+
+
+# True for an upright, target-sized indexed image that only uses panel colors, such
+# as a previous conversion. Header fields are checked before any pixels are decoded.
+def is_panel_ready(img):
+    if img.mode != "P" or img.size != (TARGET_WIDTH, TARGET_HEIGHT):
+        return False
+    if "transparency" in img.info:
+        return False
+    if img.getexif().get(ExifTags.Base.Orientation, 1) != 1:
+        return False
+    flat = img.getpalette()
+    if flat is None:
+        return False
+    used = {tuple(flat[3 * i:3 * i + 3]) for _, i in img.getcolors(256)}
+    return used <= set(PALETTE)
+
+
+# Decodes a source file to an upright RGB image, or returns a panel-ready one as is.
+def load_image(img_path):
+    with Image.open(img_path) as img:
+        if is_panel_ready(img):
+            return img.copy()
+
+        # Let libjpeg decode at a reduced scale; a no-op for other formats.
+        img.draft("RGB", draft_size(img))
+        img = ImageOps.exif_transpose(img)
+        return img.convert("RGB")
+
+
+# Uses fixed resize, contrast/color boost, unsharp mask, then panel palette quantization.
+def convert_image(img):
+    if img.mode == "P":
+        # Only panel-ready images arrive indexed; there is nothing to filter or quantize.
+        return img
+
+    img = resize_image(img)
+    img = enhance_image(img)
+
+    if DITHER_STRENGTH <= 0.0:
+        # Already a C palette-cache lookup (~1 ms per frame); a NumPy LUT gather measured slower.
+        return img.quantize(palette=_PALETTE_IMAGE, dither=DITHER_NONE)
+    elif DITHER_STRENGTH >= 1.0 and _fs_dither is None:
+        return img.quantize(palette=_PALETTE_IMAGE, dither=DITHER)
+    else:
+        # With Numba, full strength also goes through the kernel so DITHER_LINEAR_LIGHT applies.
+        return quantize_with_dither_strength(img, PALETTE, DITHER_STRENGTH)
+
+
+# Encodes in memory first so the file is written in a single call.
+def save_image(out, out_path):
+    data = io.BytesIO()
+    if OUTPUT_FORMAT.upper() == "PNG":
+        out.save(data, format="PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+    else:
+        out.convert("RGB").save(data, format="BMP")
+    with open(out_path, "wb") as f:
+        f.write(data.getbuffer())
+
+
+# Identifies one source file under the current conversion settings. Stored next to
+# each output so unchanged sources are skipped on the next run.
+def cache_key(img_path, src_stat):
+    # DITHER_LINEAR_LIGHT only changes the output when the Numba kernel dithers.
+    linear_light = DITHER_LINEAR_LIGHT and _fs_dither is not None and DITHER_STRENGTH > 0.0
+    config = (
+        CACHE_VERSION, cv2 is not None, _fs_dither is not None,
+        img_path, src_stat.st_size, src_stat.st_mtime_ns,
+        TARGET_WIDTH, TARGET_HEIGHT, CONTRAST, COLOR,
+        SHARPEN_RADIUS, SHARPEN_PERCENT, SHARPEN_THRESHOLD,
+        DITHER_STRENGTH, linear_light, OUTPUT_FORMAT, PALETTE,
+    )
+    return hashlib.blake2b(repr(config).encode()).hexdigest()[:16]
+
+
+def is_up_to_date(img_path, src_stat, out_path):
+    if not os.path.exists(out_path):
+        return False
+    try:
+        with open(out_path + CACHE_SUFFIX) as f:
+            return f.read() == cache_key(img_path, src_stat)
+    except OSError:
+        return False
+
+
+# The sidecar is removed first and rewritten last, so an interrupted save is redone.
+# src_stat is the one taken when the source was scanned, so a source that changes
+# mid-conversion no longer matches its key and is converted again next run.
+def save_output(out, img_path, src_stat, out_path):
+    meta_path = out_path + CACHE_SUFFIX
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    save_image(out, out_path)
+    with open(meta_path, "w") as f:
+        f.write(cache_key(img_path, src_stat))
+
+
+# Module-level so multiprocessing can pickle it; takes (img_path, file_name, output_dir,
+# src_stat) and hands back the job with its panel image, which is small enough to return cheaply.
+def _preprocess(job):
+    img_path = job[0]
+    print(f"Preprocessing image: {img_path}")
+    return job, convert_image(load_image(img_path))
+
+
+# Workers inherit the parent's signal handlers; restore the default so that
+# Pool.terminate() stops them immediately.
+def _init_worker():
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
 class ImageConverter:
     """
     Class to convert images for display on the e-Paper screen.
@@ -129,54 +411,70 @@ class ImageConverter:
     def __init__(self, source_dir, output_dir):
         self.source_dir = source_dir
         self.output_dir = output_dir
+        log_pillow_build()
+        warm_up_dither()
 
-    # Finds valid image files in the source directory to process.
+    # Finds valid image files in the source directory and converts the new or changed
+    # ones across all CPU cores. Outputs whose source is gone are removed.
     def process_images(self):
-        valid_extensions = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff')
+        jobs = []
+        outputs = set()
+
+        # Sorted so that, of several sources sharing a stem, the same one wins every run.
+        with os.scandir(self.source_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
 
-        for img in os.listdir(self.source_dir):
+        for entry in entries:
 
-            if img.startswith('.'):
+            if entry.name.startswith('.'):
                 continue
-            
-            print(f"Found file: {img}")
-            img_path = os.path.join(self.source_dir, img)
 
-            if os.path.isfile(img_path) and img.lower().endswith(valid_extensions):
-                print(f"Preprocessing image: {img_path}")
-                self.preprocess_image(img_path, img)
-            
+            print(f"Found file: {entry.name}")
+            if not entry.is_file(follow_symlinks=False):
+                continue
 
-    # Uses fixed resize, contrast/color boost, unsharp mask, then panel palette quantization.
-    def preprocess_image(self, img_path, file_name):
-        palette = make_palette_image(PALETTE)
-        base_name = os.path.splitext(file_name)[0]
-        out_name = f"{base_name}_waveshare6.png"
-        out_path = os.path.join(self.output_dir, out_name)
-
-        with Image.open(img_path) as img:
-            img = ImageOps.exif_transpose(img)
-            img = img.convert("RGB")
-            img = img.resize((TARGET_WIDTH, TARGET_HEIGHT), Image.Resampling.LANCZOS)
-
-            img = ImageEnhance.Contrast(img).enhance(CONTRAST)
-            img = ImageEnhance.Color(img).enhance(COLOR)
-            img = img.filter(
-                ImageFilter.UnsharpMask(
-                    radius=SHARPEN_RADIUS,
-                    percent=SHARPEN_PERCENT,
-                    threshold=SHARPEN_THRESHOLD,
-                )
-            )
-
-            if DITHER_STRENGTH <= 0.0:
-                out = img.quantize(palette=palette, dither=DITHER_NONE)
-            elif DITHER_STRENGTH >= 1.0:
-                out = img.quantize(palette=palette, dither=DITHER)
-            else:
-                out = quantize_with_dither_strength(img, PALETTE, DITHER_STRENGTH)
+            ext = entry.name.rpartition('.')[2].lower()
+            if ext in VALID_EXTS:
+                out_path = output_path(entry.name, self.output_dir)
+                out_name = os.path.basename(out_path)
+                if out_name in outputs:
+                    print(f"Skipping {entry.name}: another file already converts to {out_name}")
+                    continue
+                outputs.add(out_name)
+                src_stat = entry.stat()
+                if is_up_to_date(entry.path, src_stat, out_path):
+                    print(f"Already converted: {entry.name}")
+                    continue
+                jobs.append((entry.path, entry.name, self.output_dir, src_stat))
+
+        self.remove_stale_outputs(outputs)
+
+        if not jobs:
+            return
 
-            if OUTPUT_FORMAT.upper() == "PNG":
-                out.save(out_path, format="PNG")
+        # Each image is a large, CPU-bound job, so hand them out one at a time. Saving
+        # happens on a writer thread here so workers go straight to their next file.
+        workers = min(os.cpu_count() or 1, len(jobs))
+        saves = []
+        with ThreadPoolExecutor(max_workers=1) as writer, Pool(workers, initializer=_init_worker) as pool:
+            for (img_path, file_name, output_dir, src_stat), out in pool.imap_unordered(_preprocess, jobs):
+                out_path = output_path(file_name, output_dir)
+                saves.append(writer.submit(save_output, out, img_path, src_stat, out_path))
+
+        for save in saves:
+            save.result()
+
+    def remove_stale_outputs(self, outputs):
+        for name in os.listdir(self.output_dir):
+            if name.endswith(CACHE_SUFFIX):
+                owner = name[:-len(CACHE_SUFFIX)]
             else:
-                out.convert("RGB").save(out_path, format="BMP")
+                owner = name
+            if owner not in outputs:
+                print(f"Removing stale output: {name}")
+                os.remove(os.path.join(self.output_dir, name))
+
+    def preprocess_image(self, img_path, file_name):
+        src_stat = os.stat(img_path)
+        _, out = _preprocess((img_path, file_name, self.output_dir, src_stat))
+        save_output(out, img_path, src_stat, output_path(file_name, self.output_dir))